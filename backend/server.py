@@ -1,4 +1,5 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, Header
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
@@ -6,19 +7,38 @@ from motor.motor_asyncio import AsyncIOMotorClient
 from pydantic import BaseModel, Field, EmailStr
 from typing import List, Optional
 from datetime import datetime, timedelta
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import jwt
+from passlib.hash import bcrypt as passlib_bcrypt
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 from bson import ObjectId
+from bson.errors import InvalidId
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
 import os
+import asyncio
+import base64
+import bcrypt
+import hashlib
+import orjson
 import logging
 from pathlib import Path
 import uuid
-import openai
+import boto3
 import stripe
+from openai import AsyncOpenAI
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+# Use uvloop for the event loop when available (2x+ faster than stdlib
+# asyncio; Motor picks it up as long as it is installed before the client)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Configuration
 mongo_url = os.environ['MONGO_URL']
 db_name = os.environ['DB_NAME']
@@ -27,11 +47,14 @@ JWT_ALGORITHM = os.environ.get('JWT_ALGORITHM', 'HS256')
 JWT_EXPIRATION_HOURS = int(os.environ.get('JWT_EXPIRATION_HOURS', 720))
 
 # OpenAI Configuration (graceful handling if not set)
+# A single AsyncOpenAI client keeps the connection pool warm and, unlike
+# the sync SDK, yields the event loop during the model round trip
 openai_api_key = os.environ.get('OPENAI_API_KEY', '')
 if openai_api_key:
-    openai.api_key = openai_api_key
+    openai_client = AsyncOpenAI(api_key=openai_api_key)
     openai_configured = True
 else:
+    openai_client = None
     openai_configured = False
     logging.warning("⚠️  OPENAI_API_KEY not configured - AI recipe generation will be disabled")
 
@@ -45,18 +68,72 @@ else:
     stripe_configured = False
     logging.warning("⚠️  STRIPE keys not configured - Payment features will be disabled")
 
+# Redis Configuration (graceful handling if not set)
+redis_url = os.environ.get('REDIS_URL', '')
+if redis_url:
+    import redis.asyncio as aioredis
+    redis_client = aioredis.from_url(redis_url)
+    redis_configured = True
+else:
+    redis_client = None
+    redis_configured = False
+    logging.warning("⚠️  REDIS_URL not configured - dashboard caching uses an in-process TTL cache")
+
+# S3/MinIO Configuration (graceful handling if not set)
+s3_bucket = os.environ.get('S3_BUCKET', '')
+s3_public_url = os.environ.get('S3_PUBLIC_URL', '').rstrip('/')
+if s3_bucket:
+    s3_client = boto3.client('s3', endpoint_url=os.environ.get('S3_ENDPOINT_URL') or None)
+    s3_configured = True
+else:
+    s3_client = None
+    s3_configured = False
+    logging.warning("⚠️  S3_BUCKET not configured - images will be stored inline in MongoDB")
+
 # MongoDB connection
-client = AsyncIOMotorClient(mongo_url)
+# Explicit pool sizing: with multiple uvicorn workers (--workers $(nproc))
+# each process gets its own pool, so bound the per-worker fan-out and fail
+# fast instead of queueing indefinitely when the DB is saturated
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=int(os.environ.get('MONGO_MAX_POOL_SIZE', 200)),
+    minPoolSize=int(os.environ.get('MONGO_MIN_POOL_SIZE', 10)),
+    maxIdleTimeMS=300000,
+    serverSelectionTimeoutMS=2000,
+    waitQueueTimeoutMS=2500,
+    retryWrites=True
+)
 db = client[db_name]
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing (native bcrypt; cost tunable per deployment)
+BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', 12))
+# Legacy-hash fallback, resolved once at import time instead of going
+# through CryptContext's per-call scheme lookup
+legacy_bcrypt = passlib_bcrypt.using(rounds=BCRYPT_ROUNDS)
+
+# bcrypt burns hundreds of ms of CPU per call; run it in a thread pool so
+# the event loop stays responsive for other requests
+bcrypt_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
 
 # Security
 security = HTTPBearer()
 
-# Create FastAPI app
-app = FastAPI(title="CookingSecrets API")
+# Auth cache: validated JWT payload + user doc keyed by a hash of the token,
+# so repeated requests skip the signature check and the users lookup.
+# Short TTL bounds staleness; entries are evicted eagerly on ban/role changes.
+AUTH_CACHE_TTL_SECONDS = int(os.environ.get('AUTH_CACHE_TTL_SECONDS', 60))
+auth_cache = TTLCache(maxsize=10000, ttl=AUTH_CACHE_TTL_SECONDS)
+
+# Dashboard cache: the /dashboard/* queries are identical for every user
+# and change slowly, so a short TTL collapses N requests into 1 DB read.
+# Redis shares the cache across workers; without it each worker keeps its
+# own in-process copy.
+DASHBOARD_CACHE_TTL_SECONDS = int(os.environ.get('DASHBOARD_CACHE_TTL_SECONDS', 30))
+dashboard_cache = TTLCache(maxsize=32, ttl=DASHBOARD_CACHE_TTL_SECONDS)
+
+# Create FastAPI app (orjson serializes responses several times faster
+# than the stdlib json encoder)
+app = FastAPI(title="CookingSecrets API", default_response_class=ORJSONResponse)
 api_router = APIRouter(prefix="/api")
 
 # Configure logging
@@ -149,6 +226,24 @@ class RecipeResponse(BaseModel):
     is_saved: bool = False
     created_at: datetime
 
+class RecipeListItem(BaseModel):
+    # List view of a recipe: everything except steps, which only the
+    # detail endpoint needs (and which dominates document size)
+    id: str
+    title: str
+    ingredients: List[str]
+    image: Optional[str] = None
+    creator_id: str
+    creator_name: str
+    creator_role: str
+    is_paid: bool
+    price: float
+    likes_count: int
+    comments_count: int
+    is_liked: bool = False
+    is_saved: bool = False
+    created_at: datetime
+
 # Comment Models
 class CommentCreate(BaseModel):
     recipe_id: str
@@ -251,10 +346,22 @@ class AdminCreateStaff(BaseModel):
 # ============================================================================
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(BCRYPT_ROUNDS)).decode()
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    except ValueError:
+        # Hashes written before the native-bcrypt switch (non-$2b$ schemes)
+        return legacy_bcrypt.verify(plain_password, hashed_password)
+
+async def hash_password_async(password: str) -> str:
+    return await asyncio.get_running_loop().run_in_executor(bcrypt_pool, hash_password, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await asyncio.get_running_loop().run_in_executor(
+        bcrypt_pool, verify_password, plain_password, hashed_password
+    )
 
 def create_jwt_token(data: dict) -> str:
     to_encode = data.copy()
@@ -263,23 +370,46 @@ def create_jwt_token(data: dict) -> str:
     encoded_jwt = jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
     return encoded_jwt
 
+def _auth_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+def evict_cached_user(user_id: str):
+    # Drop every cached token entry for this user (ban/role/wallet changes)
+    stale_keys = [key for key, (_, user) in list(auth_cache.items()) if str(user["_id"]) == user_id]
+    for key in stale_keys:
+        auth_cache.pop(key, None)
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     token = credentials.credentials
+    cache_key = _auth_cache_key(token)
+
+    cached = auth_cache.get(cache_key)
+    if cached is not None:
+        payload, user = cached
+        if payload.get("exp", 0) > datetime.utcnow().timestamp():
+            return user
+        auth_cache.pop(cache_key, None)
+
     try:
         payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
         user_id = payload.get("sub")
         if user_id is None:
             raise HTTPException(status_code=401, detail="Invalid authentication credentials")
-    except JWTError:
+    except jwt.PyJWTError:
         raise HTTPException(status_code=401, detail="Invalid authentication credentials")
-    
+
     user = await db.users.find_one({"_id": ObjectId(user_id)})
     if user is None:
         raise HTTPException(status_code=401, detail="User not found")
-    
+
     if user.get("banned", False):
         raise HTTPException(status_code=403, detail="User is banned")
-    
+
+    # Handlers need the string form constantly; compute it once here so
+    # cached hits skip the per-request str(ObjectId) conversions too
+    user["_id_str"] = str(user["_id"])
+
+    auth_cache[cache_key] = (payload, user)
     return user
 
 async def get_current_staff(credentials: HTTPAuthorizationCredentials = Depends(security)):
@@ -294,8 +424,165 @@ async def get_current_admin(credentials: HTTPAuthorizationCredentials = Depends(
         raise HTTPException(status_code=403, detail="Admin access required")
     return user
 
+# Notification writes are coalesced into insert_many batches by a
+# background worker (started on app startup) so N concurrent events cost
+# one round trip instead of N
+NOTIFICATION_FLUSH_INTERVAL = 0.02
+NOTIFICATION_BATCH_SIZE = 500
+notification_queue = asyncio.Queue()
+notification_worker = None
+
+def notify_async(notification: dict):
+    """Queue a notification insert without adding a Mongo round trip to the response path."""
+    notification_queue.put_nowait(notification)
+
+async def _flush_notifications():
+    while True:
+        batch = [await notification_queue.get()]
+        # Linger briefly so bursts of notifications share one insert_many
+        try:
+            while len(batch) < NOTIFICATION_BATCH_SIZE:
+                batch.append(await asyncio.wait_for(notification_queue.get(), NOTIFICATION_FLUSH_INTERVAL))
+        except asyncio.TimeoutError:
+            pass
+        try:
+            await db.notifications.insert_many(batch, ordered=False)
+        except Exception:
+            logger.exception("Failed to flush notification batch")
+
+async def cached_query(key: str, fetch):
+    """Serve a slow-changing, user-independent query from the dashboard cache.
+
+    Cached values must be JSON-safe (stringified ids) so they survive the
+    Redis round trip unchanged.
+    """
+    if redis_configured:
+        cached = await redis_client.get(key)
+        if cached is not None:
+            return orjson.loads(cached)
+        result = await fetch()
+        await redis_client.setex(key, DASHBOARD_CACHE_TTL_SECONDS, orjson.dumps(result, default=str))
+        return result
+
+    cached = dashboard_cache.get(key)
+    if cached is not None:
+        return cached
+    result = await fetch()
+    dashboard_cache[key] = result
+    return result
+
+async def invalidate_dashboard(*keys: str):
+    for key in keys:
+        dashboard_cache.pop(key, None)
+    if redis_configured:
+        await redis_client.delete(*keys)
+
+def _upload_image_sync(data: bytes, key: str, content_type: str) -> str:
+    s3_client.put_object(Bucket=s3_bucket, Key=key, Body=data, ContentType=content_type)
+    if s3_public_url:
+        return f"{s3_public_url}/{key}"
+    return f"https://{s3_bucket}.s3.amazonaws.com/{key}"
+
+async def store_image(image: Optional[str], prefix: str) -> Optional[str]:
+    """Upload a base64 image to object storage and return its URL.
+
+    Keeps list endpoints from dragging MB-scale base64 strings through
+    BSON decode and JSON encode on every page. When S3 is not configured
+    the payload is stored inline as before.
+    """
+    if not image or not s3_configured:
+        return image
+    if image.startswith(("http://", "https://")):
+        return image
+
+    payload = image
+    content_type = "image/jpeg"
+    if payload.startswith("data:"):
+        header, _, payload = payload.partition(",")
+        content_type = header[5:].split(";")[0] or content_type
+    try:
+        raw = base64.b64decode(payload)
+    except ValueError:
+        return image
+
+    key = f"{prefix}/{uuid.uuid4()}.{content_type.split('/')[-1]}"
+    # boto3 is synchronous; keep the upload off the event loop
+    return await asyncio.get_running_loop().run_in_executor(
+        None, _upload_image_sync, raw, key, content_type
+    )
+
+def _prep(doc: dict) -> dict:
+    """Rename _id to id in place — no throwaway dict per row.
+
+    User references are stored as native ObjectIds (half the key bytes of
+    the old hex strings); responses still expose them as strings.
+    """
+    doc["id"] = str(doc.pop("_id"))
+    for key in ("user_id", "reporter_id", "reviewed_by"):
+        value = doc.get(key)
+        if isinstance(value, ObjectId):
+            doc[key] = str(value)
+    return doc
+
+def parse_object_id(value: str, label: str = "ID") -> ObjectId:
+    """Parse a hex string into an ObjectId in one pass.
+
+    Replaces the ObjectId.is_valid(x) + ObjectId(x) pairs, which parse the
+    same 24-char hex twice.
+    """
+    try:
+        return ObjectId(value)
+    except (InvalidId, TypeError):
+        raise HTTPException(status_code=400, detail=f"Invalid {label}")
+
+def recipe_flag_stages(user_id: ObjectId) -> list:
+    """Aggregation stages that compute per-user is_liked/is_saved server-side.
+
+    Joining likes/cookbook inside the recipes pipeline replaces two extra
+    round trips (and the Python set-membership pass) with a single query.
+    """
+    def user_join(collection: str, as_field: str) -> dict:
+        return {"$lookup": {
+            "from": collection,
+            "let": {"rid": {"$toString": "$_id"}},
+            "pipeline": [
+                {"$match": {"$expr": {"$and": [
+                    {"$eq": ["$user_id", user_id]},
+                    {"$eq": ["$recipe_id", "$$rid"]}
+                ]}}},
+                {"$project": {"_id": 1}}
+            ],
+            "as": as_field
+        }}
+
+    return [
+        user_join("likes", "_liked"),
+        user_join("cookbook", "_saved"),
+        {"$addFields": {
+            "is_liked": {"$gt": [{"$size": "$_liked"}, 0]},
+            "is_saved": {"$gt": [{"$size": "$_saved"}, 0]}
+        }},
+        {"$project": {"_liked": 0, "_saved": 0}}
+    ]
+
+# Fields user_to_response needs; projecting with this keeps password
+# hashes and any other baggage out of user reads
+USER_RESPONSE_PROJECTION = {
+    "email": 1,
+    "name": 1,
+    "role": 1,
+    "wallet_balance": 1,
+    "profile_image": 1,
+    "bio": 1,
+    "followers_count": 1,
+    "following_count": 1,
+    "banned": 1,
+    "created_at": 1
+}
+
 def user_to_response(user: dict) -> UserResponse:
-    return UserResponse(
+    # Data comes from our own users collection; skip re-validation
+    return UserResponse.model_construct(
         id=str(user["_id"]),
         email=user["email"],
         name=user["name"],
@@ -315,19 +602,14 @@ def user_to_response(user: dict) -> UserResponse:
 
 @api_router.post("/auth/signup", response_model=TokenResponse)
 async def signup(user_data: UserSignup):
-    # Check if user exists
-    existing_user = await db.users.find_one({"email": user_data.email})
-    if existing_user:
-        raise HTTPException(status_code=400, detail="Email already registered")
-    
     # Validate role
     if user_data.role not in [UserRole.USER, UserRole.CHEF]:
         raise HTTPException(status_code=400, detail="Invalid role. Use 'user' or 'chef'")
-    
+
     # Create user
     user = {
         "email": user_data.email,
-        "password": hash_password(user_data.password),
+        "password": await hash_password_async(user_data.password),
         "name": user_data.name,
         "role": user_data.role,
         "wallet_balance": 0.0,
@@ -339,9 +621,14 @@ async def signup(user_data: UserSignup):
         "created_at": datetime.utcnow()
     }
     
-    result = await db.users.insert_one(user)
+    # The unique email index makes the insert the existence check — no
+    # pre-flight find_one, and no race between check and insert
+    try:
+        result = await db.users.insert_one(user)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already registered")
     user["_id"] = result.inserted_id
-    
+
     # Create token
     token = create_jwt_token({"sub": str(result.inserted_id), "role": user_data.role})
     
@@ -350,8 +637,8 @@ async def signup(user_data: UserSignup):
 @api_router.post("/auth/login", response_model=TokenResponse)
 async def login(credentials: UserLogin):
     user = await db.users.find_one({"email": credentials.email})
-    
-    if not user or not verify_password(credentials.password, user["password"]):
+
+    if not user or not await verify_password_async(credentials.password, user["password"]):
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
     if user.get("banned", False):
@@ -367,8 +654,8 @@ async def login(credentials: UserLogin):
 @api_router.post("/auth/staff-login", response_model=TokenResponse)
 async def staff_login(credentials: StaffLogin):
     user = await db.users.find_one({"email": credentials.email})
-    
-    if not user or not verify_password(credentials.password, user["password"]):
+
+    if not user or not await verify_password_async(credentials.password, user["password"]):
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
     if user["role"] not in [UserRole.MODERATOR, UserRole.ADMIN]:
@@ -415,7 +702,7 @@ async def generate_recipe(
                     # and to avoid re-querying. Not used further in this handler.
                     _current_user = user
                     is_guest = False
-        except JWTError:
+        except jwt.PyJWTError:
             pass
 
     # NOTE: 'current_user' is only used for auth detection. If present, generation is not treated as guest.
@@ -432,6 +719,29 @@ async def generate_recipe(
                 detail="Guest limit reached. Please sign up to generate unlimited recipes."
             )
     
+    # Content-addressed cache: the same ingredient set reuses a prior
+    # generation instead of paying for a multi-second model call
+    cache_key = hashlib.blake2b(
+        ",".join(sorted(i.strip().lower() for i in data.ingredients)).encode(),
+        digest_size=16
+    ).hexdigest()
+    cached = await db.recipe_cache.find_one({"_id": cache_key})
+    if cached:
+        if is_guest:
+            await db.guest_sessions.update_one(
+                {"session_id": data.session_id},
+                {
+                    "$set": {"session_id": data.session_id, "updated_at": datetime.utcnow()},
+                    "$inc": {"recipe_count": 1}
+                },
+                upsert=True
+            )
+        return {
+            "success": True,
+            "recipe": cached["recipe"],
+            "requires_login": is_guest
+        }
+
     # Build OpenAI prompt
     ingredients_text = ", ".join(data.ingredients)
     prompt = f"""You are a professional chef. Create a delicious recipe using ONLY these ingredients: {ingredients_text}.
@@ -448,7 +758,7 @@ Do not include any markdown, explanations, or extra text. Only return the JSON."
 
     try:
         # Call OpenAI API
-        response = openai.chat.completions.create(
+        response = await openai_client.chat.completions.create(
             model="gpt-3.5-turbo",
             messages=[
                 {"role": "system", "content": "You are a professional chef who creates recipes in JSON format."},
@@ -461,19 +771,28 @@ Do not include any markdown, explanations, or extra text. Only return the JSON."
         recipe_text = response.choices[0].message.content.strip()
         
         # Parse JSON response
-        import json
-        recipe_data = json.loads(recipe_text)
+        recipe_data = orjson.loads(recipe_text)
         
         # Validate structure
         if "title" not in recipe_data or "ingredients" not in recipe_data or "steps" not in recipe_data:
             raise ValueError("Invalid recipe structure")
-        
+
+        now = datetime.utcnow()
+
+        # Cache the generation (expired by the TTL index on created_at)
+        await db.recipe_cache.update_one(
+            {"_id": cache_key},
+            {"$set": {"recipe": recipe_data, "created_at": now}},
+            upsert=True
+        )
+
+
         # Update guest session count
         if is_guest:
             await db.guest_sessions.update_one(
                 {"session_id": data.session_id},
                 {
-                    "$set": {"session_id": data.session_id, "updated_at": datetime.utcnow()},
+                    "$set": {"session_id": data.session_id, "updated_at": now},
                     "$inc": {"recipe_count": 1}
                 },
                 upsert=True
@@ -485,7 +804,7 @@ Do not include any markdown, explanations, or extra text. Only return the JSON."
             "requires_login": is_guest
         }
         
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         logger.error(f"Failed to parse OpenAI response: {recipe_text}")
         raise HTTPException(status_code=500, detail="Failed to parse AI response")
     except Exception as e:
@@ -502,8 +821,8 @@ async def create_recipe(recipe_data: RecipeCreate, current_user: dict = Depends(
         "title": recipe_data.title,
         "ingredients": recipe_data.ingredients,
         "steps": recipe_data.steps,
-        "image": recipe_data.image,
-        "creator_id": str(current_user["_id"]),
+        "image": await store_image(recipe_data.image, "recipes"),
+        "creator_id": current_user["_id_str"],
         "creator_name": current_user["name"],
         "creator_role": current_user["role"],
         "is_paid": recipe_data.is_paid,
@@ -516,7 +835,9 @@ async def create_recipe(recipe_data: RecipeCreate, current_user: dict = Depends(
     
     result = await db.recipes.insert_one(recipe)
     recipe["_id"] = result.inserted_id
-    
+
+    await invalidate_dashboard("dash:trending", "dash:mostliked")
+
     return RecipeResponse(
         id=str(recipe["_id"]),
         **{k: v for k, v in recipe.items() if k != "_id"},
@@ -524,7 +845,7 @@ async def create_recipe(recipe_data: RecipeCreate, current_user: dict = Depends(
         is_saved=False
     )
 
-@api_router.get("/recipes", response_model=List[RecipeResponse])
+@api_router.get("/recipes", response_model=List[RecipeListItem])
 async def get_recipes(
     skip: int = 0,
     limit: int = 20,
@@ -539,65 +860,48 @@ async def get_recipes(
     if creator_id:
         query["creator_id"] = creator_id
     
-    # Search functionality
+    # Search functionality (uses the text index on title/creator_name/ingredients)
     if search:
-        search_lower = search.lower()
-        # MongoDB text search or regex
-        query["$or"] = [
-            {"title": {"$regex": search_lower, "$options": "i"}},
-            {"creator_name": {"$regex": search_lower, "$options": "i"}},
-            {"ingredients": {"$elemMatch": {"$regex": search_lower, "$options": "i"}}},
-        ]
-    
-    recipes = await db.recipes.find(query).sort("created_at", -1).skip(skip).limit(limit).to_list(limit)
-    
-    # Get user's likes and saved recipes
-    likes = await db.likes.find({"user_id": str(current_user["_id"])}).to_list(1000)
-    liked_recipe_ids = {like["recipe_id"] for like in likes}
-    
-    saved = await db.cookbook.find({"user_id": str(current_user["_id"])}).to_list(1000)
-    saved_recipe_ids = {s["recipe_id"] for s in saved}
-    
-    result = []
-    for recipe in recipes:
-        recipe_id = str(recipe["_id"])
-        result.append(RecipeResponse(
-            id=recipe_id,
-            **{k: v for k, v in recipe.items() if k != "_id"},
-            is_liked=recipe_id in liked_recipe_ids,
-            is_saved=recipe_id in saved_recipe_ids
-        ))
-    
-    return result
+        query["$text"] = {"$search": search}
+    
+    pipeline = [
+        {"$match": query},
+        {"$sort": {"created_at": -1}},
+        {"$skip": skip},
+        {"$limit": limit},
+        {"$project": {"steps": 0}},
+    ] + recipe_flag_stages(current_user["_id"])
+    recipes = await db.recipes.aggregate(pipeline).to_list(limit)
+
+    return [
+        RecipeListItem.model_construct(**_prep(recipe))
+        for recipe in recipes
+    ]
 
 @api_router.get("/recipes/{recipe_id}", response_model=RecipeResponse)
 async def get_recipe(recipe_id: str, current_user: dict = Depends(get_current_user)):
-    if not ObjectId.is_valid(recipe_id):
-        raise HTTPException(status_code=400, detail="Invalid recipe ID")
-    
-    recipe = await db.recipes.find_one({"_id": ObjectId(recipe_id)})
-    if not recipe:
+    oid = parse_object_id(recipe_id, "recipe ID")
+    uid = current_user["_id_str"]
+
+    pipeline = [{"$match": {"_id": oid}}] + recipe_flag_stages(current_user["_id"])
+    recipes = await db.recipes.aggregate(pipeline).to_list(1)
+    if not recipes:
         raise HTTPException(status_code=404, detail="Recipe not found")
-    
+    recipe = recipes[0]
+
     # Check if user has purchased (if paid)
     if recipe["is_paid"]:
         purchase = await db.transactions.find_one({
-            "user_id": str(current_user["_id"]),
+            "user_id": current_user["_id"],
             "recipe_id": recipe_id,
             "type": "purchase"
         })
-        if not purchase and str(recipe["creator_id"]) != str(current_user["_id"]):
+        if not purchase and str(recipe["creator_id"]) != uid:
             raise HTTPException(status_code=402, detail="Recipe must be purchased")
-    
-    # Check if liked/saved
-    is_liked = await db.likes.find_one({"user_id": str(current_user["_id"]), "recipe_id": recipe_id}) is not None
-    is_saved = await db.cookbook.find_one({"user_id": str(current_user["_id"]), "recipe_id": recipe_id}) is not None
-    
+
     return RecipeResponse(
         id=str(recipe["_id"]),
-        **{k: v for k, v in recipe.items() if k != "_id"},
-        is_liked=is_liked,
-        is_saved=is_saved
+        **{k: v for k, v in recipe.items() if k != "_id"}
     )
 
 # ============================================================================
@@ -606,73 +910,79 @@ async def get_recipe(recipe_id: str, current_user: dict = Depends(get_current_us
 
 @api_router.post("/recipes/{recipe_id}/like")
 async def toggle_like(recipe_id: str, current_user: dict = Depends(get_current_user)):
-    if not ObjectId.is_valid(recipe_id):
-        raise HTTPException(status_code=400, detail="Invalid recipe ID")
-    
-    recipe = await db.recipes.find_one({"_id": ObjectId(recipe_id)})
-    if not recipe:
-        raise HTTPException(status_code=404, detail="Recipe not found")
-    
-    user_id = str(current_user["_id"])
-    like = await db.likes.find_one({"user_id": user_id, "recipe_id": recipe_id})
-    
-    if like:
-        # Unlike
-        await db.likes.delete_one({"_id": like["_id"]})
-        await db.recipes.update_one({"_id": ObjectId(recipe_id)}, {"$inc": {"likes_count": -1}})
-        return {"liked": False, "likes_count": recipe["likes_count"] - 1}
-    else:
-        # Like
+    oid = parse_object_id(recipe_id, "recipe ID")
+    user_id = current_user["_id_str"]
+    now = datetime.utcnow()
+
+    # The unique (user_id, recipe_id) index decides like vs unlike in one
+    # attempt instead of a separate existence query
+    try:
         await db.likes.insert_one({
-            "user_id": user_id,
+            "user_id": current_user["_id"],
             "recipe_id": recipe_id,
-            "created_at": datetime.utcnow()
+            "created_at": now
         })
-        await db.recipes.update_one({"_id": ObjectId(recipe_id)}, {"$inc": {"likes_count": 1}})
-        
-        # Create notification for recipe creator
-        if str(recipe["creator_id"]) != user_id:
-            await db.notifications.insert_one({
-                "user_id": str(recipe["creator_id"]),
-                "type": "like",
-                "content": f"{current_user['name']} liked your recipe '{recipe['title']}'",
-                "read": False,
-                "related_id": recipe_id,
-                "created_at": datetime.utcnow()
-            })
-        
-        return {"liked": True, "likes_count": recipe["likes_count"] + 1}
+        liked = True
+    except DuplicateKeyError:
+        await db.likes.delete_one({"user_id": current_user["_id"], "recipe_id": recipe_id})
+        liked = False
+
+    recipe = await db.recipes.find_one_and_update(
+        {"_id": oid},
+        {"$inc": {"likes_count": 1 if liked else -1}},
+        return_document=ReturnDocument.AFTER
+    )
+    if not recipe:
+        if liked:
+            await db.likes.delete_one({"user_id": current_user["_id"], "recipe_id": recipe_id})
+        raise HTTPException(status_code=404, detail="Recipe not found")
+
+    await invalidate_dashboard("dash:trending", "dash:mostliked")
+
+    # Create notification for recipe creator
+    if liked and str(recipe["creator_id"]) != user_id:
+        notify_async({
+            "user_id": ObjectId(recipe["creator_id"]),
+            "type": "like",
+            "content": f"{current_user['name']} liked your recipe '{recipe['title']}'",
+            "read": False,
+            "related_id": recipe_id,
+            "created_at": now
+        })
+
+    return {"liked": liked, "likes_count": recipe["likes_count"]}
 
 @api_router.post("/recipes/{recipe_id}/comments", response_model=CommentResponse)
 async def create_comment(recipe_id: str, comment_data: CommentCreate, current_user: dict = Depends(get_current_user)):
-    if not ObjectId.is_valid(recipe_id):
-        raise HTTPException(status_code=400, detail="Invalid recipe ID")
-    
-    recipe = await db.recipes.find_one({"_id": ObjectId(recipe_id)})
+    oid = parse_object_id(recipe_id, "recipe ID")
+    uid = current_user["_id_str"]
+    now = datetime.utcnow()
+
+    recipe = await db.recipes.find_one({"_id": oid})
     if not recipe:
         raise HTTPException(status_code=404, detail="Recipe not found")
-    
+
     comment = {
         "recipe_id": recipe_id,
-        "user_id": str(current_user["_id"]),
+        "user_id": uid,
         "user_name": current_user["name"],
         "content": comment_data.content,
         "reported": False,
-        "created_at": datetime.utcnow()
+        "created_at": now
     }
-    
+
     result = await db.comments.insert_one(comment)
-    await db.recipes.update_one({"_id": ObjectId(recipe_id)}, {"$inc": {"comments_count": 1}})
-    
+    await db.recipes.update_one({"_id": oid}, {"$inc": {"comments_count": 1}})
+
     # Create notification
-    if str(recipe["creator_id"]) != str(current_user["_id"]):
-        await db.notifications.insert_one({
-            "user_id": str(recipe["creator_id"]),
+    if str(recipe["creator_id"]) != uid:
+        notify_async({
+            "user_id": ObjectId(recipe["creator_id"]),
             "type": "comment",
             "content": f"{current_user['name']} commented on your recipe '{recipe['title']}'",
             "read": False,
             "related_id": recipe_id,
-            "created_at": datetime.utcnow()
+            "created_at": now
         })
     
     comment["_id"] = result.inserted_id
@@ -680,8 +990,8 @@ async def create_comment(recipe_id: str, comment_data: CommentCreate, current_us
 
 @api_router.get("/recipes/{recipe_id}/comments", response_model=List[CommentResponse])
 async def get_comments(recipe_id: str, current_user: dict = Depends(get_current_user)):
-    comments = await db.comments.find({"recipe_id": recipe_id}).sort("created_at", -1).to_list(100)
-    return [CommentResponse(id=str(c["_id"]), **{k: v for k, v in c.items() if k != "_id"}) for c in comments]
+    comments = await db.comments.find({"recipe_id": recipe_id}).sort("created_at", -1).limit(100).to_list(100)
+    return [CommentResponse.model_construct(**_prep(c)) for c in comments]
 
 # ============================================================================
 # COOKBOOK ENDPOINTS
@@ -689,16 +999,14 @@ async def get_comments(recipe_id: str, current_user: dict = Depends(get_current_
 
 @api_router.post("/cookbook/{recipe_id}")
 async def save_to_cookbook(recipe_id: str, current_user: dict = Depends(get_current_user)):
-    if not ObjectId.is_valid(recipe_id):
-        raise HTTPException(status_code=400, detail="Invalid recipe ID")
-    
-    recipe = await db.recipes.find_one({"_id": ObjectId(recipe_id)})
+    oid = parse_object_id(recipe_id, "recipe ID")
+
+    recipe = await db.recipes.find_one({"_id": oid})
     if not recipe:
         raise HTTPException(status_code=404, detail="Recipe not found")
     
-    user_id = str(current_user["_id"])
-    existing = await db.cookbook.find_one({"user_id": user_id, "recipe_id": recipe_id})
-    
+    existing = await db.cookbook.find_one({"user_id": current_user["_id"], "recipe_id": recipe_id})
+
     if existing:
         # Remove from cookbook
         await db.cookbook.delete_one({"_id": existing["_id"]})
@@ -707,36 +1015,29 @@ async def save_to_cookbook(recipe_id: str, current_user: dict = Depends(get_curr
         # Add to cookbook (login required for guests)
         if current_user["role"] == UserRole.GUEST:
             raise HTTPException(status_code=401, detail="Login required to save recipes")
-        
+
         await db.cookbook.insert_one({
-            "user_id": user_id,
+            "user_id": current_user["_id"],
             "recipe_id": recipe_id,
             "saved_at": datetime.utcnow()
         })
         return {"saved": True}
 
-@api_router.get("/cookbook", response_model=List[RecipeResponse])
+@api_router.get("/cookbook", response_model=List[RecipeListItem])
 async def get_cookbook(current_user: dict = Depends(get_current_user)):
-    saved = await db.cookbook.find({"user_id": str(current_user["_id"])}).sort("saved_at", -1).to_list(100)
+    saved = await db.cookbook.find({"user_id": current_user["_id"]}).sort("saved_at", -1).limit(100).to_list(100)
     recipe_ids = [ObjectId(s["recipe_id"]) for s in saved if ObjectId.is_valid(s["recipe_id"])]
-    
-    recipes = await db.recipes.find({"_id": {"$in": recipe_ids}}).to_list(100)
-    
-    # Get user's likes
-    likes = await db.likes.find({"user_id": str(current_user["_id"])}).to_list(1000)
-    liked_recipe_ids = {like["recipe_id"] for like in likes}
-    
-    result = []
-    for recipe in recipes:
-        recipe_id = str(recipe["_id"])
-        result.append(RecipeResponse(
-            id=recipe_id,
-            **{k: v for k, v in recipe.items() if k != "_id"},
-            is_liked=recipe_id in liked_recipe_ids,
-            is_saved=True
-        ))
-    
-    return result
+
+    pipeline = [
+        {"$match": {"_id": {"$in": recipe_ids}}},
+        {"$project": {"steps": 0}},
+    ] + recipe_flag_stages(current_user["_id"])
+    recipes = await db.recipes.aggregate(pipeline).to_list(100)
+
+    return [
+        RecipeListItem.model_construct(**_prep(recipe))
+        for recipe in recipes
+    ]
 
 # ============================================================================
 # WALLET & PAYMENT ENDPOINTS
@@ -767,29 +1068,31 @@ async def deposit_to_wallet(data: dict, current_user: dict = Depends(get_current
 
     # Record transaction
     await db.transactions.insert_one({
-        "user_id": str(current_user["_id"]),
+        "user_id": current_user["_id"],
         "amount": amount,
         "type": "deposit",
         "created_at": datetime.utcnow()
     })
 
+    evict_cached_user(current_user["_id_str"])
+
     return {"success": True, "new_balance": current_user.get("wallet_balance", 0.0) + amount}
 
 @api_router.post("/wallet/purchase/{recipe_id}")
 async def purchase_recipe(recipe_id: str, current_user: dict = Depends(get_current_user)):
-    if not ObjectId.is_valid(recipe_id):
-        raise HTTPException(status_code=400, detail="Invalid recipe ID")
-    
-    recipe = await db.recipes.find_one({"_id": ObjectId(recipe_id)})
+    oid = parse_object_id(recipe_id, "recipe ID")
+    uid = current_user["_id_str"]
+
+    recipe = await db.recipes.find_one({"_id": oid})
     if not recipe:
         raise HTTPException(status_code=404, detail="Recipe not found")
-    
+
     if not recipe["is_paid"]:
         raise HTTPException(status_code=400, detail="Recipe is free")
-    
+
     # Check if already purchased
     existing = await db.transactions.find_one({
-        "user_id": str(current_user["_id"]),
+        "user_id": current_user["_id"],
         "recipe_id": recipe_id,
         "type": "purchase"
     })
@@ -799,44 +1102,49 @@ async def purchase_recipe(recipe_id: str, current_user: dict = Depends(get_curre
     # Check wallet balance
     if current_user.get("wallet_balance", 0.0) < recipe["price"]:
         raise HTTPException(status_code=402, detail="Insufficient wallet balance")
-    
-    # Deduct from buyer
-    await db.users.update_one(
-        {"_id": current_user["_id"]},
-        {"$inc": {"wallet_balance": -recipe["price"]}}
-    )
-    
-    # Add to chef
-    await db.users.update_one(
-        {"_id": ObjectId(recipe["creator_id"])},
-        {"$inc": {"wallet_balance": recipe["price"]}}
+
+    now = datetime.utcnow()
+
+
+    # Buyer debit, chef credit, and the transaction record are independent
+    # $inc/insert ops — overlap their round trips instead of serializing
+    await asyncio.gather(
+        db.users.update_one(
+            {"_id": current_user["_id"]},
+            {"$inc": {"wallet_balance": -recipe["price"]}}
+        ),
+        db.users.update_one(
+            {"_id": ObjectId(recipe["creator_id"])},
+            {"$inc": {"wallet_balance": recipe["price"]}}
+        ),
+        db.transactions.insert_one({
+            "user_id": current_user["_id"],
+            "amount": recipe["price"],
+            "type": "purchase",
+            "recipe_id": recipe_id,
+            "created_at": now
+        })
     )
     
-    # Record transaction
-    await db.transactions.insert_one({
-        "user_id": str(current_user["_id"]),
-        "amount": recipe["price"],
-        "type": "purchase",
-        "recipe_id": recipe_id,
-        "created_at": datetime.utcnow()
-    })
-    
     # Create notification for chef
-    await db.notifications.insert_one({
-        "user_id": str(recipe["creator_id"]),
+    notify_async({
+        "user_id": ObjectId(recipe["creator_id"]),
         "type": "purchase",
         "content": f"{current_user['name']} purchased your recipe '{recipe['title']}'",
         "read": False,
         "related_id": recipe_id,
-        "created_at": datetime.utcnow()
+        "created_at": now
     })
-    
+
+    evict_cached_user(uid)
+    evict_cached_user(str(recipe["creator_id"]))
+
     return {"success": True, "message": "Recipe purchased successfully"}
 
 @api_router.get("/wallet/transactions", response_model=List[TransactionResponse])
 async def get_transactions(current_user: dict = Depends(get_current_user)):
-    transactions = await db.transactions.find({"user_id": str(current_user["_id"])}).sort("created_at", -1).to_list(100)
-    return [TransactionResponse(id=str(t["_id"]), **{k: v for k, v in t.items() if k != "_id"}) for t in transactions]
+    transactions = await db.transactions.find({"user_id": current_user["_id"]}).sort("created_at", -1).limit(100).to_list(100)
+    return [TransactionResponse.model_construct(**_prep(t)) for t in transactions]
 
 # ============================================================================
 # NOTIFICATION ENDPOINTS
@@ -844,16 +1152,15 @@ async def get_transactions(current_user: dict = Depends(get_current_user)):
 
 @api_router.get("/notifications", response_model=List[NotificationResponse])
 async def get_notifications(current_user: dict = Depends(get_current_user)):
-    notifications = await db.notifications.find({"user_id": str(current_user["_id"])}).sort("created_at", -1).to_list(50)
-    return [NotificationResponse(id=str(n["_id"]), **{k: v for k, v in n.items() if k != "_id"}) for n in notifications]
+    notifications = await db.notifications.find({"user_id": current_user["_id"]}).sort("created_at", -1).limit(50).to_list(50)
+    return [NotificationResponse.model_construct(**_prep(n)) for n in notifications]
 
 @api_router.post("/notifications/{notification_id}/read")
 async def mark_notification_read(notification_id: str, current_user: dict = Depends(get_current_user)):
-    if not ObjectId.is_valid(notification_id):
-        raise HTTPException(status_code=400, detail="Invalid notification ID")
-    
+    oid = parse_object_id(notification_id, "notification ID")
+
     await db.notifications.update_one(
-        {"_id": ObjectId(notification_id), "user_id": str(current_user["_id"])},
+        {"_id": oid, "user_id": current_user["_id"]},
         {"$set": {"read": True}}
     )
     return {"success": True}
@@ -864,19 +1171,24 @@ async def mark_notification_read(notification_id: str, current_user: dict = Depe
 
 @api_router.post("/moderation/report", response_model=ReportResponse)
 async def report_comment(report_data: ReportCreate, current_user: dict = Depends(get_current_user)):
-    if not ObjectId.is_valid(report_data.comment_id):
-        raise HTTPException(status_code=400, detail="Invalid comment ID")
-    
-    comment = await db.comments.find_one({"_id": ObjectId(report_data.comment_id)})
+    oid = parse_object_id(report_data.comment_id, "comment ID")
+
+    # The lookup and the flag update are independent, so issue them
+    # together; the $ne guard makes re-reports a no-op write, and a
+    # missing comment makes the update match nothing
+    comment, _ = await asyncio.gather(
+        db.comments.find_one({"_id": oid}, {"content": 1}),
+        db.comments.update_one(
+            {"_id": oid, "reported": {"$ne": True}},
+            {"$set": {"reported": True}}
+        )
+    )
     if not comment:
         raise HTTPException(status_code=404, detail="Comment not found")
     
-    # Mark comment as reported
-    await db.comments.update_one({"_id": ObjectId(report_data.comment_id)}, {"$set": {"reported": True}})
-    
     report = {
         "comment_id": report_data.comment_id,
-        "reporter_id": str(current_user["_id"]),
+        "reporter_id": current_user["_id"],
         "reporter_name": current_user["name"],
         "comment_content": comment["content"],
         "reason": report_data.reason,
@@ -887,51 +1199,49 @@ async def report_comment(report_data: ReportCreate, current_user: dict = Depends
     
     result = await db.reports.insert_one(report)
     report["_id"] = result.inserted_id
-    
-    return ReportResponse(id=str(report["_id"]), **{k: v for k, v in report.items() if k != "_id"})
+
+    return ReportResponse.model_construct(**_prep(report))
 
 @api_router.get("/moderation/reports", response_model=List[ReportResponse])
 async def get_reports(current_user: dict = Depends(get_current_staff)):
-    reports = await db.reports.find({"status": "pending"}).sort("created_at", -1).to_list(100)
-    return [ReportResponse(id=str(r["_id"]), **{k: v for k, v in r.items() if k != "_id"}) for r in reports]
+    reports = await db.reports.find({"status": "pending"}).sort("created_at", -1).limit(100).to_list(100)
+    return [ReportResponse.model_construct(**_prep(r)) for r in reports]
 
 @api_router.post("/moderation/reports/{report_id}/ignore")
 async def ignore_report(report_id: str, current_user: dict = Depends(get_current_staff)):
-    if not ObjectId.is_valid(report_id):
-        raise HTTPException(status_code=400, detail="Invalid report ID")
-    
+    oid = parse_object_id(report_id, "report ID")
+
     await db.reports.update_one(
-        {"_id": ObjectId(report_id)},
-        {"$set": {"status": "ignored", "reviewed_by": str(current_user["_id"])}}
+        {"_id": oid},
+        {"$set": {"status": "ignored", "reviewed_by": current_user["_id"]}}
     )
     return {"success": True}
 
 @api_router.post("/moderation/reports/{report_id}/escalate")
 async def escalate_report(report_id: str, current_user: dict = Depends(get_current_staff)):
-    if not ObjectId.is_valid(report_id):
-        raise HTTPException(status_code=400, detail="Invalid report ID")
-    
-    report = await db.reports.find_one({"_id": ObjectId(report_id)})
-    if not report:
-        raise HTTPException(status_code=404, detail="Report not found")
-    
-    await db.reports.update_one(
-        {"_id": ObjectId(report_id)},
-        {"$set": {"status": "escalated", "reviewed_by": str(current_user["_id"])}}
+    oid = parse_object_id(report_id, "report ID")
+
+    report = await db.reports.find_one_and_update(
+        {"_id": oid},
+        {"$set": {"status": "escalated", "reviewed_by": current_user["_id"]}},
+        projection={"_id": 1}
     )
+    if report is None:
+        raise HTTPException(status_code=404, detail="Report not found")
     
-    # Notify all admins
-    admins = await db.users.find({"role": UserRole.ADMIN}).to_list(100)
+    # Notify all admins (queued as one batch; only the ids are needed)
+    admins = await db.users.find({"role": UserRole.ADMIN}, {"_id": 1}).to_list(100)
+    now = datetime.utcnow()
     for admin in admins:
-        await db.notifications.insert_one({
-            "user_id": str(admin["_id"]),
+        notify_async({
+            "user_id": admin["_id"],
             "type": "escalation",
             "content": f"Report escalated by {current_user['name']}",
             "read": False,
             "related_id": report_id,
-            "created_at": datetime.utcnow()
+            "created_at": now
         })
-    
+
     return {"success": True}
 
 # ============================================================================
@@ -940,53 +1250,57 @@ async def escalate_report(report_id: str, current_user: dict = Depends(get_curre
 
 @api_router.post("/admin/create-moderator")
 async def create_moderator(email: EmailStr, password: str, name: str, current_user: dict = Depends(get_current_admin)):
-    # Check if user exists
-    existing = await db.users.find_one({"email": email})
-    if existing:
-        raise HTTPException(status_code=400, detail="Email already registered")
-    
     moderator = {
         "email": email,
-        "password": hash_password(password),
+        "password": await hash_password_async(password),
         "name": name,
         "role": UserRole.MODERATOR,
         "wallet_balance": 0.0,
         "banned": False,
         "created_at": datetime.utcnow()
     }
-    
-    result = await db.users.insert_one(moderator)
+
+    # The unique email index rejects duplicates; no preflight lookup needed
+    try:
+        result = await db.users.insert_one(moderator)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already registered")
     return {"success": True, "moderator_id": str(result.inserted_id)}
 
 @api_router.post("/admin/update-role")
 async def update_user_role(data: UserUpdateRole, current_user: dict = Depends(get_current_admin)):
-    if not ObjectId.is_valid(data.user_id):
-        raise HTTPException(status_code=400, detail="Invalid user ID")
-    
+    oid = parse_object_id(data.user_id, "user ID")
+
     if data.new_role not in [UserRole.USER, UserRole.CHEF, UserRole.MODERATOR]:
         raise HTTPException(status_code=400, detail="Invalid role")
-    
+
     await db.users.update_one(
-        {"_id": ObjectId(data.user_id)},
+        {"_id": oid},
         {"$set": {"role": data.new_role}}
     )
+    evict_cached_user(data.user_id)
     return {"success": True}
 
 @api_router.post("/admin/ban-user")
 async def ban_user(data: UserBan, current_user: dict = Depends(get_current_admin)):
-    if not ObjectId.is_valid(data.user_id):
-        raise HTTPException(status_code=400, detail="Invalid user ID")
-    
+    oid = parse_object_id(data.user_id, "user ID")
+
     await db.users.update_one(
-        {"_id": ObjectId(data.user_id)},
+        {"_id": oid},
         {"$set": {"banned": data.banned}}
     )
+    evict_cached_user(data.user_id)
     return {"success": True}
 
 @api_router.get("/admin/users", response_model=List[UserResponse])
-async def get_all_users(current_user: dict = Depends(get_current_admin)):
-    users = await db.users.find({}).sort("created_at", -1).to_list(1000)
-    return [user_to_response(u) for u in users]
+async def get_all_users(skip: int = 0, limit: int = 50, current_user: dict = Depends(get_current_admin)):
+    # Paginate instead of materializing up to 1000 full documents per call;
+    # the created_at sort walks its index, so skip/limit never hydrates
+    # documents outside the page
+    skip = max(skip, 0)
+    limit = min(max(limit, 1), 200)
+    cursor = db.users.find({}, USER_RESPONSE_PROJECTION).sort("created_at", -1).skip(skip).limit(limit)
+    return [user_to_response(u) async for u in cursor]
 
 @api_router.post("/admin/create-staff")
 async def create_staff_account(data: AdminCreateStaff, current_user: dict = Depends(get_current_admin)):
@@ -994,13 +1308,9 @@ async def create_staff_account(data: AdminCreateStaff, current_user: dict = Depe
     if data.role not in [UserRole.ADMIN, UserRole.MODERATOR]:
         raise HTTPException(status_code=400, detail="Role must be 'admin' or 'moderator'")
 
-    existing = await db.users.find_one({"email": data.email})
-    if existing:
-        raise HTTPException(status_code=400, detail="Email already registered")
-
     staff = {
         "email": data.email,
-        "password": hash_password(data.password),
+        "password": await hash_password_async(data.password),
         "name": data.name,
         "role": data.role,
         "wallet_balance": 0.0,
@@ -1008,53 +1318,57 @@ async def create_staff_account(data: AdminCreateStaff, current_user: dict = Depe
         "created_at": datetime.utcnow()
     }
 
-    result = await db.users.insert_one(staff)
+    try:
+        result = await db.users.insert_one(staff)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already registered")
     return {"success": True, "staff_id": str(result.inserted_id)}
 
 @api_router.post("/moderation/ban-user")
 async def moderation_ban_user(data: ModerateBanUser, current_user: dict = Depends(get_current_staff)):
     # Moderators/Admins can ban/unban any non-admin users.
-    if not ObjectId.is_valid(data.user_id):
-        raise HTTPException(status_code=400, detail="Invalid user ID")
-
-    target = await db.users.find_one({"_id": ObjectId(data.user_id)})
-    if not target:
+    oid = parse_object_id(data.user_id, "user ID")
+
+    # The role guard lives in the filter, so the happy path is one round
+    # trip; only failures pay a second query to pick the right error
+    target = await db.users.find_one_and_update(
+        {"_id": oid, "role": {"$ne": UserRole.ADMIN}},
+        {"$set": {"banned": data.banned}},
+        projection={"role": 1}
+    )
+    if target is None:
+        if await db.users.count_documents({"_id": oid}, limit=1):
+            raise HTTPException(status_code=403, detail="Cannot ban an admin")
         raise HTTPException(status_code=404, detail="User not found")
 
-    if target.get("role") == UserRole.ADMIN:
-        raise HTTPException(status_code=403, detail="Cannot ban an admin")
-
-    await db.users.update_one(
-        {"_id": ObjectId(data.user_id)},
-        {"$set": {"banned": data.banned}}
-    )
+    evict_cached_user(data.user_id)
 
     return {"success": True}
 
 @api_router.post("/moderation/delete-recipe")
 async def moderation_delete_recipe(data: ModerateDeleteRecipe, current_user: dict = Depends(get_current_staff)):
     recipe_id = data.recipe_id
+    oid = parse_object_id(recipe_id, "recipe ID")
 
-    if not ObjectId.is_valid(recipe_id):
-        raise HTTPException(status_code=400, detail="Invalid recipe ID")
-
-    recipe = await db.recipes.find_one({"_id": ObjectId(recipe_id)})
+    recipe = await db.recipes.find_one({"_id": oid})
     if not recipe:
         raise HTTPException(status_code=404, detail="Recipe not found")
 
-    await db.recipes.delete_one({"_id": ObjectId(recipe_id)})
-
-    # Optional: clean related entities
-    await db.comments.delete_many({"recipe_id": recipe_id})
-    await db.likes.delete_many({"recipe_id": recipe_id})
-    await db.cookbook.delete_many({"recipe_id": recipe_id})
+    # The recipe delete and the related-entity cleanup are independent;
+    # overlap their round trips
+    await asyncio.gather(
+        db.recipes.delete_one({"_id": oid}),
+        db.comments.delete_many({"recipe_id": recipe_id}),
+        db.likes.delete_many({"recipe_id": recipe_id}),
+        db.cookbook.delete_many({"recipe_id": recipe_id})
+    )
 
     return {"success": True}
 
 @api_router.get("/admin/reports/escalated", response_model=List[ReportResponse])
 async def get_escalated_reports(current_user: dict = Depends(get_current_admin)):
-    reports = await db.reports.find({"status": "escalated"}).sort("created_at", -1).to_list(100)
-    return [ReportResponse(id=str(r["_id"]), **{k: v for k, v in r.items() if k != "_id"}) for r in reports]
+    reports = await db.reports.find({"status": "escalated"}).sort("created_at", -1).limit(100).to_list(100)
+    return [ReportResponse.model_construct(**_prep(r)) for r in reports]
 
 # ============================================================================
 # PANTRY ENDPOINTS
@@ -1079,9 +1393,9 @@ async def create_pantry_item(item_data: PantryItemCreate, current_user: dict = D
         raise HTTPException(status_code=400, detail="Quantity for 'number' type must be an integer")
     
     item = {
-        "user_id": str(current_user["_id"]),
+        "user_id": current_user["_id"],
         "name": item_data.name,
-        "image": item_data.image,
+        "image": await store_image(item_data.image, "pantry"),
         "quantity_type": item_data.quantity_type,
         "quantity": item_data.quantity if item_data.quantity_type != "none" else 0,
         "created_at": datetime.utcnow()
@@ -1089,70 +1403,60 @@ async def create_pantry_item(item_data: PantryItemCreate, current_user: dict = D
     
     result = await db.pantry.insert_one(item)
     item["_id"] = result.inserted_id
-    
-    return PantryItemResponse(
-        id=str(item["_id"]),
-        **{k: v for k, v in item.items() if k != "_id"}
-    )
+
+    return PantryItemResponse.model_construct(**_prep(item))
 
 @api_router.get("/pantry", response_model=List[PantryItemResponse])
 async def get_pantry_items(current_user: dict = Depends(get_current_user)):
     # Get user's pantry items sorted by creation date
-    items = await db.pantry.find({"user_id": str(current_user["_id"])}).sort("created_at", -1).to_list(100)
-    return [PantryItemResponse(id=str(item["_id"]), **{k: v for k, v in item.items() if k != "_id"}) for item in items]
+    items = await db.pantry.find({"user_id": current_user["_id"]}).sort("created_at", -1).limit(100).to_list(100)
+    return [PantryItemResponse.model_construct(**_prep(item)) for item in items]
 
 @api_router.put("/pantry/{item_id}", response_model=PantryItemResponse)
 async def update_pantry_item(item_id: str, update_data: PantryItemUpdate, current_user: dict = Depends(get_current_user)):
-    if not ObjectId.is_valid(item_id):
-        raise HTTPException(status_code=400, detail="Invalid item ID")
-    
-    item = await db.pantry.find_one({"_id": ObjectId(item_id)})
-    if not item:
-        raise HTTPException(status_code=404, detail="Item not found")
-    
-    # Ownership check
-    if str(item["user_id"]) != str(current_user["_id"]):
-        raise HTTPException(status_code=403, detail="Not authorized to update this item")
-    
+    oid = parse_object_id(item_id, "item ID")
+    uid = current_user["_id_str"]
+
     # Validation: quantity must be non-negative
     if update_data.quantity < 0:
         raise HTTPException(status_code=400, detail="Quantity cannot be negative")
-    
-    # Validation: number type must be integer
-    if item["quantity_type"] == "number" and update_data.quantity != int(update_data.quantity):
-        raise HTTPException(status_code=400, detail="Quantity for 'number' type must be an integer")
-    
-    # For "none" type, quantity should remain 0
-    if item["quantity_type"] == "none":
-        raise HTTPException(status_code=400, detail="Cannot update quantity for checklist items")
-    
-    await db.pantry.update_one(
-        {"_id": ObjectId(item_id)},
-        {"$set": {"quantity": update_data.quantity}}
-    )
-    
-    item["quantity"] = update_data.quantity
-    
-    return PantryItemResponse(
-        id=str(item["_id"]),
-        **{k: v for k, v in item.items() if k != "_id"}
+
+    # Ownership and type constraints move into the filter so the happy
+    # path is a single find_one_and_update instead of find_one + update_one
+    query = {"_id": oid, "user_id": current_user["_id"], "quantity_type": {"$ne": "none"}}
+    if update_data.quantity != int(update_data.quantity):
+        # Fractional quantities are only valid for weight-based items
+        query["quantity_type"] = "kg"
+
+    item = await db.pantry.find_one_and_update(
+        query,
+        {"$set": {"quantity": update_data.quantity}},
+        return_document=ReturnDocument.AFTER
     )
+    if item is None:
+        # Only failures pay a second query to pick the right error
+        existing = await db.pantry.find_one({"_id": oid})
+        if not existing:
+            raise HTTPException(status_code=404, detail="Item not found")
+        if str(existing["user_id"]) != uid:
+            raise HTTPException(status_code=403, detail="Not authorized to update this item")
+        if existing["quantity_type"] == "none":
+            raise HTTPException(status_code=400, detail="Cannot update quantity for checklist items")
+        raise HTTPException(status_code=400, detail="Quantity for 'number' type must be an integer")
+
+    return PantryItemResponse.model_construct(**_prep(item))
 
 @api_router.delete("/pantry/{item_id}")
 async def delete_pantry_item(item_id: str, current_user: dict = Depends(get_current_user)):
-    if not ObjectId.is_valid(item_id):
-        raise HTTPException(status_code=400, detail="Invalid item ID")
-    
-    item = await db.pantry.find_one({"_id": ObjectId(item_id)})
-    if not item:
+    oid = parse_object_id(item_id, "item ID")
+
+    # Ownership check folded into the filter: one round trip when it succeeds
+    item = await db.pantry.find_one_and_delete({"_id": oid, "user_id": current_user["_id"]})
+    if item is None:
+        if await db.pantry.count_documents({"_id": oid}, limit=1):
+            raise HTTPException(status_code=403, detail="Not authorized to delete this item")
         raise HTTPException(status_code=404, detail="Item not found")
-    
-    # Ownership check
-    if str(item["user_id"]) != str(current_user["_id"]):
-        raise HTTPException(status_code=403, detail="Not authorized to delete this item")
-    
-    await db.pantry.delete_one({"_id": ObjectId(item_id)})
-    
+
     return {"success": True, "message": "Item deleted"}
 
 # ============================================================================
@@ -1161,60 +1465,119 @@ async def delete_pantry_item(item_id: str, current_user: dict = Depends(get_curr
 
 @api_router.get("/dashboard/trending")
 async def get_trending_recipes(current_user: dict = Depends(get_current_user)):
-    # Get most liked recipes in last 7 days
-    seven_days_ago = datetime.utcnow() - timedelta(days=7)
-    recipes = await db.recipes.find({
-        "created_at": {"$gte": seven_days_ago}
-    }).sort("likes_count", -1).limit(10).to_list(10)
-    
-    return recipes
+    async def fetch():
+        # Get most liked recipes in last 7 days
+        seven_days_ago = datetime.utcnow() - timedelta(days=7)
+        recipes = await db.recipes.find({
+            "created_at": {"$gte": seven_days_ago}
+        }).sort("likes_count", -1).limit(10).to_list(10)
+        for recipe in recipes:
+            recipe["_id"] = str(recipe["_id"])
+        return recipes
+
+    return await cached_query("dash:trending", fetch)
 
 @api_router.get("/dashboard/top-chefs")
 async def get_top_chefs(current_user: dict = Depends(get_current_user)):
-    # Get chefs with highest earnings
-    chefs = await db.users.find({"role": UserRole.CHEF}).sort("wallet_balance", -1).limit(10).to_list(10)
-    return [user_to_response(chef) for chef in chefs]
+    async def fetch():
+        # Get chefs with highest earnings
+        chefs = await db.users.find(
+            {"role": UserRole.CHEF}, USER_RESPONSE_PROJECTION
+        ).sort("wallet_balance", -1).limit(10).to_list(10)
+        return [user_to_response(chef).model_dump(mode="json") for chef in chefs]
+
+    return await cached_query("dash:topchefs", fetch)
 
 @api_router.get("/dashboard/most-liked")
 async def get_most_liked_recipes(current_user: dict = Depends(get_current_user)):
-    # Get top 3 recipes by like count for social proof
-    recipes = await db.recipes.find({}).sort("likes_count", -1).limit(3).to_list(3)
-    
-    # Get user's likes
-    likes = await db.likes.find({"user_id": str(current_user["_id"])}).to_list(1000)
-    liked_recipe_ids = {like["recipe_id"] for like in likes}
-    
-    result = []
-    for recipe in recipes:
-        recipe_id = str(recipe["_id"])
-        result.append(RecipeResponse(
-            id=recipe_id,
-            **{k: v for k, v in recipe.items() if k != "_id"},
-            is_liked=recipe_id in liked_recipe_ids,
+    uid = current_user["_id"]
+    cache_key = "dash:mostliked"
+
+    recipes = None
+    if redis_configured:
+        cached = await redis_client.get(cache_key)
+        if cached is not None:
+            recipes = orjson.loads(cached)
+    else:
+        recipes = dashboard_cache.get(cache_key)
+
+    if recipes is None:
+        # Cache miss: one aggregation returns the top 3 recipes and this
+        # user's likes for them in a single round trip
+        pipeline = [
+            {"$sort": {"likes_count": -1}},
+            {"$limit": 3},
+            {"$lookup": {
+                "from": "likes",
+                "let": {"rid": {"$toString": "$_id"}},
+                "pipeline": [
+                    {"$match": {"$expr": {"$and": [
+                        {"$eq": ["$user_id", uid]},
+                        {"$eq": ["$recipe_id", "$$rid"]}
+                    ]}}},
+                    {"$project": {"_id": 1}}
+                ],
+                "as": "_liked"
+            }},
+        ]
+        recipes = await db.recipes.aggregate(pipeline).to_list(3)
+
+        liked_recipe_ids = set()
+        for recipe in recipes:
+            recipe["id"] = str(recipe.pop("_id"))
+            if recipe.pop("_liked"):
+                liked_recipe_ids.add(recipe["id"])
+
+        # Cache only the user-independent recipe list
+        if redis_configured:
+            await redis_client.setex(
+                cache_key, DASHBOARD_CACHE_TTL_SECONDS, orjson.dumps(recipes, default=str)
+            )
+        else:
+            dashboard_cache[cache_key] = recipes
+    else:
+        # Cache hit: only this user's likes for these 3 recipes are needed
+        recipe_ids = [r["id"] for r in recipes]
+        liked_recipe_ids = {
+            like["recipe_id"]
+            async for like in db.likes.find(
+                {"user_id": uid, "recipe_id": {"$in": recipe_ids}},
+                {"recipe_id": 1, "_id": 0}
+            )
+        }
+
+    return [
+        RecipeResponse.model_construct(
+            **recipe,
+            is_liked=recipe["id"] in liked_recipe_ids,
             is_saved=False
-        ))
-    
-    return result
+        )
+        for recipe in recipes
+    ]
 
 @api_router.get("/users/top-creator")
 async def get_top_creator(current_user: dict = Depends(get_current_user)):
-    # Get creator with highest earnings (most successful monetization)
-    # This drives marketplace discovery
-    top_creator = await db.users.find_one(
-        {"role": {"$in": [UserRole.CHEF, UserRole.USER]}},
-        sort=[("wallet_balance", -1)]
-    )
-    
-    if not top_creator:
-        return None
-    
-    return {
-        "id": str(top_creator["_id"]),
-        "name": top_creator["name"],
-        "role": top_creator["role"],
-        "wallet_balance": top_creator.get("wallet_balance", 0.0),
-        "metric": "Most Earned"
-    }
+    async def fetch():
+        # Get creator with highest earnings (most successful monetization)
+        # This drives marketplace discovery
+        top_creator = await db.users.find_one(
+            {"role": {"$in": [UserRole.CHEF, UserRole.USER]}},
+            {"name": 1, "role": 1, "wallet_balance": 1},
+            sort=[("wallet_balance", -1)]
+        )
+
+        if not top_creator:
+            return None
+
+        return {
+            "id": str(top_creator["_id"]),
+            "name": top_creator["name"],
+            "role": top_creator["role"],
+            "wallet_balance": top_creator.get("wallet_balance", 0.0),
+            "metric": "Most Earned"
+        }
+
+    return await cached_query("dash:topcreator", fetch)
 
 # ============================================================================
 # HEALTH CHECK
@@ -1241,6 +1604,65 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def create_indexes():
+    # Indexes for the hot query paths; create_index is a no-op when the
+    # index already exists
+    await db.users.create_index("email", unique=True)
+    await db.likes.create_index([("user_id", 1), ("recipe_id", 1)], unique=True)
+    await db.cookbook.create_index([("user_id", 1), ("recipe_id", 1)], unique=True)
+    await db.transactions.create_index([("user_id", 1), ("recipe_id", 1), ("type", 1)])
+    await db.recipes.create_index([("created_at", -1)])
+    await db.recipes.create_index([("category", 1), ("created_at", -1)])
+    await db.recipes.create_index([("title", "text"), ("creator_name", "text"), ("ingredients", "text")])
+    await db.comments.create_index([("recipe_id", 1), ("created_at", -1)])
+    await db.notifications.create_index([("user_id", 1), ("created_at", -1)])
+    # Reports are only ever listed by status=pending/escalated; partial
+    # indexes keep the index tiny as resolved reports accumulate
+    await db.reports.create_index(
+        [("created_at", -1)],
+        partialFilterExpression={"status": "pending"},
+        name="reports_pending_created"
+    )
+    await db.reports.create_index(
+        [("created_at", -1)],
+        partialFilterExpression={"status": "escalated"},
+        name="reports_escalated_created"
+    )
+    await db.pantry.create_index([("user_id", 1), ("created_at", -1)])
+    await db.recipes.create_index([("created_at", -1), ("likes_count", -1)])
+    await db.users.create_index([("role", 1), ("wallet_balance", -1)])
+    await db.recipe_cache.create_index("created_at", expireAfterSeconds=86400 * 7)
+
+@app.on_event("startup")
+async def migrate_user_id_types():
+    # user_id used to be stored as 24-char hex strings; native ObjectIds
+    # halve the key bytes, so convert anything left over from that era.
+    # Each update_many matches nothing once the data is converted
+    for collection in (db.likes, db.cookbook, db.notifications, db.transactions, db.pantry):
+        await collection.update_many(
+            {"user_id": {"$type": "string"}},
+            [{"$set": {"user_id": {"$toObjectId": "$user_id"}}}]
+        )
+    for field in ("reporter_id", "reviewed_by"):
+        await db.reports.update_many(
+            {field: {"$type": "string"}},
+            [{"$set": {field: {"$toObjectId": f"${field}"}}}]
+        )
+
+@app.on_event("startup")
+async def start_notification_worker():
+    global notification_worker
+    notification_worker = asyncio.create_task(_flush_notifications())
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    if notification_worker:
+        notification_worker.cancel()
+    # Flush anything still queued before closing the client
+    pending = []
+    while not notification_queue.empty():
+        pending.append(notification_queue.get_nowait())
+    if pending:
+        await db.notifications.insert_many(pending, ordered=False)
     client.close()